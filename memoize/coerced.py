@@ -21,9 +21,13 @@ try:
 
     logger.info('Passed tornado availability check - using tornado')
 
+    def _timeout(method_timeout: datetime.timedelta) -> datetime.timedelta:
+        return method_timeout
+
+
     # ignore for mypy as types are resolved in runtime
-    def _apply_timeout(method_timeout: datetime.timedelta, future: Future) -> Future:  # type: ignore
-        return gen.with_timeout(method_timeout, future)
+    def _apply_timeout(timeout: datetime.timedelta, future: Future) -> Future:  # type: ignore
+        return gen.with_timeout(timeout, future)
 
 
     def _call_later(delay: datetime.timedelta, callback):
@@ -34,6 +38,10 @@ try:
         return IOLoop.current().spawn_callback(callback, *args)
 
 
+    def _call_soon_sync(callback, *args):
+        IOLoop.current().add_callback(callback, *args)
+
+
     def _future():
         return Future()
 
@@ -46,9 +54,21 @@ except ImportError:
 
     logger.info('Using asyncio instead of torando')
 
+    try:
+        _running_loop = asyncio.get_running_loop
+    except AttributeError:  # python < 3.7
+        _running_loop = asyncio.get_event_loop
+
     # ignore for mypy as types are resolved in runtime
-    def _apply_timeout(method_timeout: datetime.timedelta, future: asyncio.Future) -> asyncio.Future:  # type: ignore
-        return asyncio.wait_for(future, method_timeout.total_seconds())
+    def _timeout(method_timeout: datetime.timedelta) -> float:  # type: ignore
+        return method_timeout.total_seconds()
+
+
+    # 'asyncio.timeout' is not used as it cancels the task entering it - coroutine may be resumed by other runner
+    # (like tornado.gen driving memoized call awaited in asyncio task), so unrelated task would be cancelled then
+    # ignore for mypy as types are resolved in runtime
+    def _apply_timeout(timeout: float, future: asyncio.Future) -> asyncio.Future:  # type: ignore
+        return asyncio.wait_for(future, timeout)
 
 
     def _call_later(delay: datetime.timedelta, callback):
@@ -56,7 +76,11 @@ except ImportError:
 
 
     def _call_soon(callback, *args):
-        asyncio.get_event_loop().call_soon(asyncio.ensure_future, callback(*args))
+        _running_loop().create_task(callback(*args))
+
+
+    def _call_soon_sync(callback, *args):
+        _running_loop().call_soon(callback, *args)
 
 
     def _future():
@@ -5,6 +5,7 @@ of full cache configuration.
 
 from abc import ABCMeta, abstractmethod
 from datetime import timedelta
+from typing import Optional
 
 from memoize.entrybuilder import CacheEntryBuilder, ProvidedLifeSpanCacheEntryBuilder
 from memoize.eviction import EvictionStrategy, LeastRecentlyUpdatedEvictionStrategy
@@ -20,6 +21,10 @@ class NotConfiguredCacheCalledException(Exception):
 class CacheConfiguration(metaclass=ABCMeta):
     """ Provides configuration for cache. """
 
+    # Changes whenever configured components change (so cache may rely on components obtained for the same version).
+    # None means components may change at any time (so they are obtained again on each call).
+    _version = None  # type: Optional[int]
+
     @abstractmethod
     def configured(self) -> bool:
         """ Cache will raise NotConfiguredCacheCalledException if this returns false.
@@ -75,6 +80,8 @@ class MutableCacheConfiguration(CacheConfiguration):
         self.__entry_builder = entry_builder
         self.__method_timeout = method_timeout
         self.__eviction_strategy = eviction_strategy
+        # subclasses may obtain components differently - they stay unversioned unless they opt in
+        self._version = 0 if type(self) is MutableCacheConfiguration else None
 
     @staticmethod
     def initialized_with(configuration: CacheConfiguration) -> 'MutableCacheConfiguration':
@@ -105,29 +112,34 @@ class MutableCacheConfiguration(CacheConfiguration):
     def eviction_strategy(self) -> EvictionStrategy:
         return self.__eviction_strategy
 
+    def __changed(self) -> 'MutableCacheConfiguration':
+        if self._version is not None:
+            self._version += 1
+        return self
+
     def set_method_timeout(self, value: timedelta) -> 'MutableCacheConfiguration':
         self.__method_timeout = value
-        return self
+        return self.__changed()
 
     def set_key_extractor(self, value: KeyExtractor) -> 'MutableCacheConfiguration':
         self.__key_extractor = value
-        return self
+        return self.__changed()
 
     def set_configured(self, value: bool) -> 'MutableCacheConfiguration':
         self.__configured = value
-        return self
+        return self.__changed()
 
     def set_storage(self, value: CacheStorage) -> 'MutableCacheConfiguration':
         self.__storage = value
-        return self
+        return self.__changed()
 
     def set_entry_builder(self, value: CacheEntryBuilder) -> 'MutableCacheConfiguration':
         self.__entry_builder = value
-        return self
+        return self.__changed()
 
     def set_eviction_strategy(self, value: EvictionStrategy) -> 'MutableCacheConfiguration':
         self.__eviction_strategy = value
-        return self
+        return self.__changed()
 
 
 class DefaultInMemoryCacheConfiguration(CacheConfiguration):
@@ -142,6 +154,8 @@ class DefaultInMemoryCacheConfiguration(CacheConfiguration):
         self.__key_extractor = EncodedMethodReferenceAndArgsKeyExtractor()
         self.__eviction_strategy = LeastRecentlyUpdatedEvictionStrategy(capacity=capacity)
         self.__entry_builder = ProvidedLifeSpanCacheEntryBuilder(update_after=update_after, expire_after=expire_after)
+        # components are never replaced (but subclasses may obtain them differently)
+        self._version = 0 if type(self) is DefaultInMemoryCacheConfiguration else None
 
     def configured(self) -> bool:
         return self.__configured
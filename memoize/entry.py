@@ -4,21 +4,37 @@
 
 import datetime
 
-from typing import Any
+from typing import Any, Dict
 
 CacheKey = str
 CachedValue = Any
 
+_EPOCH = datetime.datetime(1970, 1, 1)
+_MICROSECOND = datetime.timedelta(microseconds=1)
+
+
+def _to_epoch_ns(moment: datetime.datetime) -> int:
+    """Converts datetime (naive ones are treated as UTC) to integer nanoseconds since epoch."""
+    if moment.tzinfo is not None:
+        moment = moment.astimezone(datetime.timezone.utc).replace(tzinfo=None)
+    return (moment - _EPOCH) // _MICROSECOND * 1000
+
 
 class CacheEntry:
     """Implementation of cache entry used internally"""
 
+    __slots__ = ('value', 'created', 'update_after', 'expires_after', 'update_after_ns', 'expires_after_ns',
+                 '__hashable')
+
     def __init__(self, created: datetime.datetime, update_after: datetime.datetime, expires_after: datetime.datetime,
                  value: CachedValue) -> None:
         self.value = value
         self.created = created
         self.update_after = update_after
         self.expires_after = expires_after
+        # integer deadlines (see: time.time_ns) allow cheap comparisons on each cache read
+        self.update_after_ns = _to_epoch_ns(update_after)
+        self.expires_after_ns = _to_epoch_ns(expires_after)
         self.__hashable = (self.value, self.created, self.update_after, self.expires_after)
 
     def __repr__(self) -> str:
@@ -26,6 +42,15 @@ class CacheEntry:
             .format(value=self.value, created=self.created,
                     update_after=self.update_after, expires_after=self.expires_after)
 
+    def __getstate__(self) -> Dict[str, Any]:
+        # same state as pickled by older (dict-based) versions, so entries are readable by them
+        return {'value': self.value, 'created': self.created, 'update_after': self.update_after,
+                'expires_after': self.expires_after, '_CacheEntry__hashable': self.__hashable}
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        # integer deadlines are not pickled (and entries pickled by older versions do not carry them at all)
+        self.__init__(state['created'], state['update_after'], state['expires_after'], state['value'])  # type: ignore
+
     def __str__(self) -> str:
         return self.__repr__()
 
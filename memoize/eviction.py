@@ -7,7 +7,7 @@ This interface is used in cache configuration.
 import collections
 from abc import ABCMeta, abstractmethod
 
-from typing import Optional
+from typing import Optional, List
 
 from memoize.entry import CacheKey, CacheEntry
 
@@ -18,6 +18,13 @@ class EvictionStrategy(metaclass=ABCMeta):
         """Informs strategy that entry related to given key was read by current client."""
         raise NotImplementedError()
 
+    def mark_read_batch(self, keys: List[CacheKey]) -> None:
+        """Informs strategy that entries related to given keys were read (in given order) by current client.
+        Strategies overriding this method get reads reported this way in batches - shortly after they happened
+        (and before any entry is written or released). Otherwise 'mark_read' is called upon every read."""
+        for key in keys:
+            self.mark_read(key)
+
     @abstractmethod
     def mark_written(self, key: CacheKey, entry: CacheEntry) -> None:
         """Informs strategy that entry related to given key was updated by current client."""
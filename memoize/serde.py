@@ -4,6 +4,7 @@ of SerDe that may be used to implement cache storage.
 """
 
 import codecs
+import functools
 import pickle
 
 try:
@@ -11,10 +12,14 @@ try:
 except:
     # ignoring type error as mypy falsely reports json is already imported
     import json  # type: ignore
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore
 from abc import ABCMeta, abstractmethod
 from datetime import datetime
 
-from typing import Callable, Any
+from typing import Callable, Any, Optional
 
 from memoize.entry import CacheEntry, CachedValue
 
@@ -50,17 +55,44 @@ JsonReversibleObject = Any
 class JsonSerDe(SerDe):
     """Uses encoded json string as binary representation. 
     Value of cached type should consist of types which are json-reversible (json.loads(json.dumps(v)) is equal to v)
-    or one should provide (by constructor) functions converting values to/from such representation."""
+    or one should provide (by constructor) functions converting values to/from such representation.
+
+    By default ujson (if installed) or json is used. Other json implementation may be provided (by constructor)
+    as functions converting objects to/from json string.
+
+    Faster orjson may be requested by 'use_orjson' flag (supported only for 'utf-8' encoding). Note that orjson
+    handles some values differently: NaN/Infinity are written as null, integers wider than 64 bits are rejected,
+    UUIDs are written as strings (so they are read back as strings). Datetimes and dataclasses are rejected
+    (as with json), so are subclasses of str, int, dict and list (to keep values json-reversible)."""
 
     def __init__(self, string_encoding: str = "utf-8",
                  value_to_reversible_repr: Callable[[CachedValue], JsonReversibleObject] = lambda x: x,
-                 reversible_repr_to_value: Callable[[JsonReversibleObject], CachedValue] = lambda x: x, ) -> None:
-        self.__string_encoding = string_encoding
+                 reversible_repr_to_value: Callable[[JsonReversibleObject], CachedValue] = lambda x: x,
+                 encoder: Optional[Callable[[JsonReversibleObject], str]] = None,
+                 decoder: Optional[Callable[[str], JsonReversibleObject]] = None,
+                 use_orjson: bool = False, ) -> None:
         self.__reversible_repr_to_value = reversible_repr_to_value
         self.__value_to_reversible_repr = value_to_reversible_repr
 
+        if use_orjson:
+            if orjson is None:
+                raise ImportError("'use_orjson' requires orjson to be installed (see 'orjson' extra)")
+            if encoder is not None or decoder is not None or codecs.lookup(string_encoding).name != 'utf-8':
+                raise ValueError("'use_orjson' supports neither custom encoder/decoder nor encodings other than utf-8")
+            # orjson reads & writes utf-8 encoded bytes directly
+            options = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS \
+                | orjson.OPT_PASSTHROUGH_SUBCLASS
+            dumps = functools.partial(orjson.dumps, option=options)  # type: Callable[[Any], bytes]
+            self.__dumps = dumps
+            self.__loads = orjson.loads  # type: Callable[[bytes], JsonReversibleObject]
+        else:
+            encode = encoder if encoder is not None else json.dumps
+            decode = decoder if decoder is not None else json.loads
+            self.__dumps = lambda obj: encode(obj).encode(string_encoding)
+            self.__loads = lambda data: decode(data.decode(string_encoding))
+
     def deserialize(self, data: bytes) -> CacheEntry:
-        as_dict = json.loads(codecs.decode(data, self.__string_encoding))
+        as_dict = self.__loads(data)
         return CacheEntry(
             created=datetime.utcfromtimestamp(as_dict['created']),
             update_after=datetime.utcfromtimestamp(as_dict['update_after']),
@@ -69,12 +101,12 @@ class JsonSerDe(SerDe):
         )
 
     def serialize(self, entry: CacheEntry) -> bytes:
-        return codecs.encode(json.dumps({
+        return self.__dumps({
             'created': entry.created.timestamp(),
             'update_after': entry.update_after.timestamp(),
             'expires_after': entry.expires_after.timestamp(),
             'value': self.__value_to_reversible_repr(entry.value),
-        }), self.__string_encoding)
+        })
 
 
 # types are ignored as everything works just fine with bytes instead of strings
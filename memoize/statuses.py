@@ -28,16 +28,28 @@ class UpdateStatuses:
         if key in self._updates_in_progress:
             raise ValueError('Key {} is already being updated'.format(key))
 
+        self._start_update(key)
+
+    def try_begin_update(self, key: CacheKey) -> Optional[Future]:
+        """Informs that update has been started unless other update for given key is already in progress.
+        Returns None if update has been started (as with 'mark_being_updated')
+        or future of the update in progress (as with 'await_updated') otherwise."""
+        update = self._updates_in_progress.get(key)
+        if update is not None:
+            return update
+
+        self._start_update(key)
+        return None
+
+    def _start_update(self, key: CacheKey) -> None:
         future = coerced._future()
         self._updates_in_progress[key] = future
 
         def complete_on_timeout_passed():
-            if key not in self._updates_in_progress:
-                return
-            if self._updates_in_progress[key] == future and not self._updates_in_progress[key].done():
+            if self._updates_in_progress.get(key) is future and not future.done():
                 self.logger.debug('Update task timed out - notifying clients awaiting for key %s', key)
-                self._updates_in_progress[key].set_result(None)
                 self._updates_in_progress.pop(key)
+                self._fail(future, TimeoutError('Update for key {} timed out'.format(key)))
 
         coerced._call_later(self._update_lock_timeout, complete_on_timeout_passed)
 
@@ -49,17 +61,24 @@ class UpdateStatuses:
         update = self._updates_in_progress.pop(key)
         update.set_result(entry)
 
-    def mark_update_aborted(self, key: CacheKey) -> None:
-        """Informs that update failed to complete.
+    def mark_update_aborted(self, key: CacheKey, exception: Optional[Exception] = None) -> None:
+        """Informs that update failed to complete (clients awaiting for the update get given exception raised).
         Calls to 'is_being_updated' will return False until 'mark_being_updated' will be called."""
         if key not in self._updates_in_progress:
             raise ValueError('Key {} is not being updated'.format(key))
         update = self._updates_in_progress.pop(key)
-        update.set_result(None)
+        self._fail(update, exception if exception is not None else
+                   RuntimeError('Update for key {} aborted'.format(key)))
+
+    @staticmethod
+    def _fail(update: Future, exception: Exception) -> None:
+        update.set_exception(exception)
+        # marks exception as retrieved - there may be no clients awaiting for the update (nothing to be logged then)
+        update.exception()
 
-    def await_updated(self, key: CacheKey) -> Awaitable[Optional[CacheEntry]]:
+    def await_updated(self, key: CacheKey) -> Awaitable[CacheEntry]:
         """Waits (asynchronously) until update in progress has benn finished.
-        Returns updated entry or None if update failed/timed-out.
+        Returns updated entry or raises exception if update failed/timed-out.
         Should be called only if 'is_being_updated' returned True (and since then IO-loop has not been lost)."""
         if not self.is_being_updated(key):
             raise ValueError('Key {} is not being updated'.format(key))
@@ -6,10 +6,13 @@ This interface is used in cache configuration.
 
 from abc import ABCMeta, abstractmethod
 
-from typing import Optional, Dict
+from typing import Optional, Dict, Union
 
 from memoize.entry import CacheKey, CacheEntry
 
+# value that 'try_get' implementations return if entry cannot be obtained without awaiting 'get'
+ASYNC_REQUIRED = object()
+
 
 class CacheStorage(metaclass=ABCMeta):
     @abstractmethod
@@ -18,6 +21,14 @@ class CacheStorage(metaclass=ABCMeta):
         Has to be async."""
         raise NotImplementedError()
 
+    def try_get(self, key: CacheKey) -> Union[Optional[CacheEntry], object]:
+        """Request value for given key without suspending (same result as 'get' would provide).
+        Implementations that cannot provide it without suspending (for instance as IO is needed) must return
+        ASYNC_REQUIRED - it informs that 'get' has to be awaited (this is what default implementation does).
+        Used only if the class providing this method also provides the effective 'get' (subclasses overriding
+        just 'get' have it awaited)."""
+        return ASYNC_REQUIRED
+
     @abstractmethod
     async def offer(self, key: CacheKey, entry: CacheEntry) -> None:
         """Offer entry to be stored. If storage already has more relevant data, offer may be declined. 
@@ -44,3 +55,6 @@ class LocalInMemoryCacheStorage(CacheStorage):
 
     async def get(self, key: CacheKey) -> Optional[CacheEntry]:
         return self._data.get(key, None)
+
+    def try_get(self, key: CacheKey) -> Optional[CacheEntry]:
+        return self._data.get(key, None)
@@ -3,22 +3,77 @@
 """
 
 import asyncio
-import datetime
 import functools
 import logging
-from typing import Optional, Callable
+import time
+from logging import DEBUG
+from typing import Optional, Callable, Tuple, Any, Dict, List, Type
 
-from memoize.coerced import _apply_timeout, _call_soon, _timeout_error_type
+from memoize.coerced import _apply_timeout, _call_soon, _call_soon_sync, _timeout, _timeout_error_type
 from memoize.configuration import CacheConfiguration, NotConfiguredCacheCalledException, \
     DefaultInMemoryCacheConfiguration, MutableCacheConfiguration
 from memoize.entry import CacheKey, CacheEntry
+from memoize.entrybuilder import CacheEntryBuilder
+from memoize.eviction import EvictionStrategy
 from memoize.exceptions import CachedMethodFailedException
 from memoize.invalidation import InvalidationSupport
+from memoize.key import KeyExtractor, EncodedMethodReferenceAndArgsKeyExtractor, EncodedMethodNameAndArgsKeyExtractor
 from memoize.statuses import UpdateStatuses
+from memoize.storage import CacheStorage, ASYNC_REQUIRED
+
+try:
+    from time import time_ns as _time_ns
+except ImportError:  # python < 3.7
+    def _time_ns() -> int:
+        return int(time.time() * 1000000000)
+
+# built-in extractors derive keys solely from args' string representations, which are stable for args of types below
+# (floats are excluded as 0.0 and -0.0 are equal while being formatted differently)
+_KEY_CACHING_EXTRACTORS = (EncodedMethodReferenceAndArgsKeyExtractor, EncodedMethodNameAndArgsKeyExtractor)
+_KEY_CACHING_ARG_TYPES = frozenset((str, bytes, int, bool, type(None)))
+_KEY_CACHE_SIZE = 1024
+_READ_BUFFER_SIZE = 16
+
+
+def _key_formatter(method: Callable, key_extractor: KeyExtractor) -> Callable[[Tuple[Any, ...], Dict[str, Any]], str]:
+    format_key = key_extractor.format_key
+    if type(key_extractor) not in _KEY_CACHING_EXTRACTORS:
+        return lambda args, kwargs: format_key(method, args, kwargs)
+
+    @functools.lru_cache(maxsize=_KEY_CACHE_SIZE, typed=True)
+    def format_cached_key(*args, **kwargs) -> str:
+        return format_key(method, args, kwargs)
+
+    def format_key_caching_simple_args(args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> str:
+        for arg in args:
+            if type(arg) not in _KEY_CACHING_ARG_TYPES:
+                return format_key(method, args, kwargs)
+        for arg in kwargs.values():
+            if type(arg) not in _KEY_CACHING_ARG_TYPES:
+                return format_key(method, args, kwargs)
+        return format_cached_key(*args, **kwargs)
+
+    return format_key_caching_simple_args
+
+
+@functools.lru_cache(maxsize=None)
+def _answers_try_get(storage_type: Type[CacheStorage]) -> bool:
+    # 'try_get' is trusted only if class providing it provides effective 'get' as well
+    # (subclasses overriding just 'get' - to collect metrics, fall back to other storage etc. - are awaited as usual)
+    if storage_type.try_get is CacheStorage.try_get:
+        return False
+    provider = next(cls for cls in storage_type.__mro__ if 'try_get' in vars(cls))
+    return storage_type.get is vars(provider).get('get')
+
+
+def _batches_reads(eviction_strategy: EvictionStrategy) -> bool:
+    """Strategies overriding 'mark_read_batch' opt in for batched reads (others get 'mark_read' upon every read)."""
+    return isinstance(eviction_strategy, EvictionStrategy) \
+        and type(eviction_strategy).mark_read_batch is not EvictionStrategy.mark_read_batch
 
 
 def memoize(method: Optional[Callable] = None, configuration: CacheConfiguration = None,
-            invalidation: InvalidationSupport = None):
+            invalidation: InvalidationSupport = None, supports_force_refresh: bool = True):
     """Wraps function with memoization.
 
     If entry reaches time it should be updated, refresh is performed in background,
@@ -34,6 +89,7 @@ def memoize(method: Optional[Callable] = None, configuration: CacheConfiguration
 
     To force refreshing immediately upon call to a cached method, set 'force_refresh_memoized' keyword flag, so
     the method will block until it's cache is refreshed.
+    If no caller uses this flag, support for it may be disabled (then the flag is passed to the method as-is).
 
     Warning: Leaving default configuration is a bad idea as it may not fit your data (may cause OOMs 
     or cache for an inappropriate time).
@@ -41,6 +97,7 @@ def memoize(method: Optional[Callable] = None, configuration: CacheConfiguration
     :param function method:                         function to be decorated
     :param CacheConfiguration configuration:        cache configuration; default: DefaultInMemoryCacheConfiguration
     :param InvalidationSupport invalidation:        pass created instance of InvalidationSupport to have it configured
+    :param bool supports_force_refresh:             whether 'force_refresh_memoized' flag is handled; default: True
 
     :raises: CachedMethodFailedException            upon call: if cached method timed-out or thrown an exception
     :raises: NotConfiguredCacheCalledException      upon call: if provided configuration is not ready
@@ -49,65 +106,119 @@ def memoize(method: Optional[Callable] = None, configuration: CacheConfiguration
     if method is None:
         if configuration is None:
             configuration = DefaultInMemoryCacheConfiguration()
-        return functools.partial(memoize, configuration=configuration, invalidation=invalidation)
-
-    if invalidation is not None and not invalidation._initialized() and configuration is not None:
-        invalidation._initialize(configuration.storage(), configuration.key_extractor(), method)
+        return functools.partial(memoize, configuration=configuration, invalidation=invalidation,
+                                 supports_force_refresh=supports_force_refresh)
 
     logger = logging.getLogger('{}@{}'.format(memoize.__name__, method.__name__))
     logger.debug('wrapping %s with memoization - configuration: %s', method.__name__, configuration)
+    debug = logger.debug
+    is_enabled_for = logger.isEnabledFor
 
     update_statuses = UpdateStatuses()
 
-    async def try_release(key: CacheKey, configuration_snapshot: CacheConfiguration) -> bool:
+    # reads are reported in batches to strategies opting in for it (see: _batches_reads)
+    # buffer is flushed before any entry is written or released, so strategy observes events in order
+    read_buffer = []  # type: List[CacheKey]
+    read_buffer_strategy = None  # type: Optional[EvictionStrategy]
+
+    def flush_reads() -> None:
+        nonlocal read_buffer
+        if not read_buffer or read_buffer_strategy is None:
+            return
+        keys, read_buffer = read_buffer, []
+        read_buffer_strategy.mark_read_batch(keys)
+
+    def buffer_read(key: CacheKey) -> None:
+        if not read_buffer:
+            _call_soon_sync(flush_reads)
+        read_buffer.append(key)
+        if len(read_buffer) >= _READ_BUFFER_SIZE:
+            flush_reads()
+
+    # components of configuration snapshot - taken again only once configuration changes (see: _version)
+    snapshot = None  # type: Optional[tuple]
+    snapshot_version = None  # type: Optional[int]
+    key_formatter_extractor, key_formatter = None, None  # type: Optional[KeyExtractor], Optional[Callable]
+
+    def take_snapshot(version: Optional[int]) -> None:
+        nonlocal snapshot, snapshot_version, key_formatter_extractor, key_formatter, read_buffer_strategy
+        configuration_snapshot = MutableCacheConfiguration.initialized_with(configuration)
+        storage = configuration_snapshot.storage()
+        key_extractor = configuration_snapshot.key_extractor()
+        if key_extractor is not key_formatter_extractor:
+            key_formatter_extractor, key_formatter = key_extractor, _key_formatter(method, key_extractor)
+        # in-memory storages provide entries without suspending (so awaiting 'get' is not needed)
+        try_get = storage.try_get if isinstance(storage, CacheStorage) and _answers_try_get(type(storage)) else None
+        # timeout is converted once (to representation used by _apply_timeout)
+        timeout = _timeout(configuration_snapshot.method_timeout())
+        eviction_strategy = configuration_snapshot.eviction_strategy()
+        if eviction_strategy is not read_buffer_strategy:
+            flush_reads()
+            read_buffer_strategy = eviction_strategy if _batches_reads(eviction_strategy) else None
+        mark_read = buffer_read if read_buffer_strategy is not None else eviction_strategy.mark_read
+        snapshot = (storage, try_get, configuration_snapshot.entry_builder(), timeout,
+                    eviction_strategy, mark_read, key_formatter)
+        snapshot_version = version
+
+    if invalidation is not None and not invalidation._initialized() and configuration is not None:
+        invalidation._initialize(configuration.storage(), configuration.key_extractor(), method)
+
+    async def try_release(key: CacheKey, storage: CacheStorage, eviction_strategy: EvictionStrategy) -> bool:
         if update_statuses.is_being_updated(key):
             return False
         try:
-            await configuration_snapshot.storage().release(key)
-            configuration_snapshot.eviction_strategy().mark_released(key)
-            logger.debug('Released cache key %s', key)
+            await storage.release(key)
+            flush_reads()
+            eviction_strategy.mark_released(key)
+            if is_enabled_for(DEBUG):
+                debug('Released cache key %s', key)
             return True
         except Exception as e:
             logger.error('Failed to release cache key %s', key, e)
             return False
 
     async def refresh(actual_entry: Optional[CacheEntry], key: CacheKey,
-                      value_future_provider: Callable[[], asyncio.Future],
-                      configuration_snapshot: CacheConfiguration):
-        if actual_entry is None and update_statuses.is_being_updated(key):
-            logger.debug('As entry expired, waiting for results of concurrent refresh %s', key)
-            entry = await update_statuses.await_updated(key)
-            if entry is None:
-                raise CachedMethodFailedException('Concurrent refresh failed to complete')
-            return entry
-        elif actual_entry is not None and update_statuses.is_being_updated(key):
-            logger.debug('As update point reached but concurrent update already in progress, '
-                         'relying on concurrent refresh to finish %s', key)
-            return actual_entry
-        elif not update_statuses.is_being_updated(key):
-            update_statuses.mark_being_updated(key)
+                      args: Tuple[Any, ...], kwargs: Dict[str, Any], timeout: Any,
+                      storage: CacheStorage, eviction_strategy: EvictionStrategy, entry_builder: CacheEntryBuilder):
+        update = update_statuses.try_begin_update(key)
+        if update is not None:
+            if actual_entry is None:
+                if is_enabled_for(DEBUG):
+                    debug('As entry expired, waiting for results of concurrent refresh %s', key)
+                try:
+                    return await update
+                except Exception as e:
+                    raise CachedMethodFailedException('Concurrent refresh failed to complete') from e
+            else:
+                if is_enabled_for(DEBUG):
+                    debug('As update point reached but concurrent update already in progress, '
+                          'relying on concurrent refresh to finish %s', key)
+                return actual_entry
+        else:
             try:
-                value_future = value_future_provider()
-                value = await value_future
-                offered_entry = configuration_snapshot.entry_builder().build(key, value)
-                await configuration_snapshot.storage().offer(key, offered_entry)
+                value = await _apply_timeout(timeout, method(*args, **kwargs))
+                offered_entry = entry_builder.build(key, value)
+                await storage.offer(key, offered_entry)
                 update_statuses.mark_updated(key, offered_entry)
-                logger.debug('Successfully refreshed cache for key %s', key)
+                flush_reads()
+                if is_enabled_for(DEBUG):
+                    debug('Successfully refreshed cache for key %s', key)
 
-                eviction_strategy = configuration_snapshot.eviction_strategy()
                 eviction_strategy.mark_written(key, offered_entry)
                 to_release = eviction_strategy.next_to_release()
                 if to_release is not None:
-                    _call_soon(try_release, to_release, configuration_snapshot)
+                    _call_soon(try_release, to_release, storage, eviction_strategy)
 
                 return offered_entry
             except (asyncio.TimeoutError, _timeout_error_type()) as e:
-                logger.debug('Timeout for %s: %s', key, e)
-                update_statuses.mark_update_aborted(key)
+                if is_enabled_for(DEBUG):
+                    debug('Timeout for %s: %s', key, e)
+                update_statuses.mark_update_aborted(key, e)
                 raise CachedMethodFailedException('Refresh timed out')
             except Exception as e:
-                logger.debug('Error while refreshing cache for %s: %s', key, e)
-                update_statuses.mark_update_aborted(key)
+                if is_enabled_for(DEBUG):
+                    debug('Error while refreshing cache for %s: %s', key, e)
+                update_statuses.mark_update_aborted(key, e)
                 raise CachedMethodFailedException('Refresh failed to complete', e)
 
     @functools.wraps(method)
@@ -115,32 +226,42 @@ def memoize(method: Optional[Callable] = None, configuration: CacheConfiguration
         if not configuration.configured():
             raise NotConfiguredCacheCalledException()
 
-        configuration_snapshot = MutableCacheConfiguration.initialized_with(configuration)
+        version = getattr(configuration, '_version', None)
+        if version is None or version != snapshot_version:
+            take_snapshot(version)
+        storage, try_get, entry_builder, timeout, eviction_strategy, mark_read, format_key = snapshot
 
-        force_refresh = kwargs.pop('force_refresh_memoized', False)
-        key = configuration_snapshot.key_extractor().format_key(method, args, kwargs)
+        force_refresh = supports_force_refresh and kwargs.pop('force_refresh_memoized', False)
+        key = format_key(args, kwargs)
 
-        current_entry = await configuration_snapshot.storage().get(key)  # type: Optional[CacheEntry]
+        current_entry = try_get(key) if try_get is not None else ASYNC_REQUIRED
+        if current_entry is ASYNC_REQUIRED:
+            current_entry = await storage.get(key)  # type: Optional[CacheEntry]
         if current_entry is not None:
-            configuration_snapshot.eviction_strategy().mark_read(key)
-
-        now = datetime.datetime.utcnow()
+            mark_read(key)
 
-        def value_future_provider():
-            return _apply_timeout(configuration_snapshot.method_timeout(), method(*args, **kwargs))
+        now = _time_ns()
 
         if current_entry is None:
-            logger.debug('Creating (blocking) entry for key %s', key)
-            result = await refresh(current_entry, key, value_future_provider, configuration_snapshot)
+            if is_enabled_for(DEBUG):
+                debug('Creating (blocking) entry for key %s', key)
+            result = await refresh(current_entry, key, args, kwargs, timeout,
+                                   storage, eviction_strategy, entry_builder)
         elif force_refresh:
-            logger.debug('Forced entry update (blocking) for key %s', key)
-            result = await refresh(current_entry, key, value_future_provider, configuration_snapshot)
-        elif current_entry.expires_after <= now:
-            logger.debug('Entry expiration reached - entry update (blocking) for key %s', key)
-            result = await refresh(None, key, value_future_provider, configuration_snapshot)
-        elif current_entry.update_after <= now:
-            logger.debug('Entry update point expired - entry update (async - current entry returned) for key %s', key)
-            _call_soon(refresh, current_entry, key, value_future_provider, configuration_snapshot)
+            if is_enabled_for(DEBUG):
+                debug('Forced entry update (blocking) for key %s', key)
+            result = await refresh(current_entry, key, args, kwargs, timeout,
+                                   storage, eviction_strategy, entry_builder)
+        elif current_entry.expires_after_ns <= now:
+            if is_enabled_for(DEBUG):
+                debug('Entry expiration reached - entry update (blocking) for key %s', key)
+            result = await refresh(None, key, args, kwargs, timeout,
+                                   storage, eviction_strategy, entry_builder)
+        elif current_entry.update_after_ns <= now:
+            if is_enabled_for(DEBUG):
+                debug('Entry update point expired - entry update (async - current entry returned) for key %s', key)
+            _call_soon(refresh, current_entry, key, args, kwargs, timeout,
+                       storage, eviction_strategy, entry_builder)
             result = current_entry
         else:
             result = current_entry
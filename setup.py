@@ -32,6 +32,7 @@ setup(
     extras_require={
         'tornado': ['tornado>4,<5'],
         'ujson': ['ujson>=1.35,<2'],
+        'orjson': ['orjson>=3.3,<4'],
     },
     classifiers=[
         'Topic :: Software Development :: Libraries',
@@ -8,6 +8,7 @@ from datetime import timedelta
 from unittest.mock import Mock
 
 import tornado
+from tornado import gen
 from tornado.platform.asyncio import to_asyncio_future
 from tornado.testing import AsyncTestCase, gen_test
 
@@ -16,6 +17,7 @@ from memoize.configuration import MutableCacheConfiguration, NotConfiguredCacheC
     DefaultInMemoryCacheConfiguration
 from memoize.eviction import LeastRecentlyUpdatedEvictionStrategy
 from memoize.exceptions import CachedMethodFailedException
+from memoize.invalidation import InvalidationSupport
 from memoize.storage import LocalInMemoryCacheStorage
 from memoize.wrapper import memoize
 from tests import _ensure_asyncio_background_tasks_finished
@@ -160,6 +162,41 @@ class MemoizationTests(AsyncTestCase):
         self.assertEqual(0, res1)
         self.assertEqual(1, res2)
 
+    @gen_test
+    async def test_should_return_updated_value_on_force_refresh(self):
+        # given
+        value = 0
+
+        @memoize()
+        async def get_value(arg, kwarg=None):
+            return value
+
+        # when
+        res1 = await get_value('test', kwarg='args')
+        value = 1
+        res2 = await get_value('test', kwarg='args', force_refresh_memoized=True)
+        res3 = await get_value('test', kwarg='args')
+
+        # then
+        self.assertEqual(0, res1)
+        self.assertEqual(1, res2)
+        self.assertEqual(1, res3)
+
+    @gen_test
+    async def test_should_pass_force_refresh_flag_to_method_on_support_disabled(self):
+        # given
+        @memoize(supports_force_refresh=False)
+        async def get_value(arg, force_refresh_memoized=None):
+            return force_refresh_memoized
+
+        # when
+        res1 = await get_value('test')
+        res2 = await get_value('test', force_refresh_memoized=True)
+
+        # then
+        self.assertIsNone(res1)
+        self.assertTrue(res2)
+
     @gen_test
     async def test_should_return_same_value_on_constant_key_function(self):
         # given
@@ -222,6 +259,95 @@ class MemoizationTests(AsyncTestCase):
         self.assertIsNotNone(s3)
         self.assertIsNotNone(s4)
 
+    @gen_test
+    async def test_should_not_return_entry_released_by_eviction_strategy(self):
+        # given
+        value = 0
+
+        @memoize(
+            configuration=MutableCacheConfiguration
+                .initialized_with(DefaultInMemoryCacheConfiguration())
+                .set_eviction_strategy(LeastRecentlyUpdatedEvictionStrategy(capacity=0))
+        )
+        async def get_value(arg, kwarg=None):
+            return value
+
+        # when
+        res1 = await get_value('test', kwarg='args')
+        await _ensure_asyncio_background_tasks_finished()
+        value = 1
+        res2 = await get_value('test', kwarg='args')
+
+        # then
+        self.assertEqual(0, res1)
+        self.assertEqual(1, res2)
+
+    @gen_test
+    async def test_should_not_return_entry_invalidated_for_arguments(self):
+        # given
+        value = 0
+        invalidation = InvalidationSupport()
+
+        @memoize(invalidation=invalidation)
+        async def get_value(arg, kwarg=None):
+            return value
+
+        # when
+        res1 = await get_value('test', kwarg='args')
+        value = 1
+        await invalidation.invalidate_for_arguments(('test',), {'kwarg': 'args'})
+        res2 = await get_value('test', kwarg='args')
+
+        # then
+        self.assertEqual(0, res1)
+        self.assertEqual(1, res2)
+
+    @gen_test
+    async def test_should_use_components_set_after_configuration_has_been_used(self):
+        # given
+        value = 0
+        configuration = MutableCacheConfiguration.initialized_with(DefaultInMemoryCacheConfiguration())
+
+        @memoize(configuration=configuration)
+        async def get_value(arg, kwarg=None):
+            return value
+
+        # when
+        res1 = await get_value('test', kwarg='args')
+        value = 1
+        configuration.set_storage(LocalInMemoryCacheStorage())
+        res2 = await get_value('test', kwarg='args')
+
+        # then
+        self.assertEqual(0, res1)
+        self.assertEqual(1, res2)
+
+    @gen_test
+    async def test_should_await_get_of_storage_subclass_overriding_only_get(self):
+        # given
+        requested_keys = []
+
+        class CountingStorage(LocalInMemoryCacheStorage):
+            async def get(self, key):
+                requested_keys.append(key)
+                return await super().get(key)
+
+        @memoize(
+            configuration=MutableCacheConfiguration
+                .initialized_with(DefaultInMemoryCacheConfiguration())
+                .set_storage(CountingStorage())
+        )
+        async def get_value(arg, kwarg=None):
+            return 0
+
+        # when
+        await get_value('test', kwarg='args')
+        await get_value('test', kwarg='args')
+        await get_value('test', kwarg='args')
+
+        # then
+        self.assertEqual(3, len(requested_keys))
+
     @gen_test
     async def test_should_throw_exception_on_configuration_not_ready(self):
         # given
@@ -275,6 +401,56 @@ class MemoizationTests(AsyncTestCase):
         expected = CachedMethodFailedException('Refresh timed out')
         self.assertEqual(str(expected), str(context.exception))  # ToDo: consider better comparision
 
+    @gen_test
+    async def test_should_throw_exception_on_refresh_timeout_when_resumed_by_tornado_coroutine(self):
+        # given
+        @memoize(configuration=DefaultInMemoryCacheConfiguration(method_timeout=timedelta(milliseconds=50)))
+        async def get_value(arg, kwarg=None):
+            await asyncio.sleep(.200)
+            return 0
+
+        @gen.coroutine
+        def get_value_by_tornado_coroutine():
+            value = yield get_value('test1', kwarg='args1')
+            return value
+
+        async def get_value_in_asyncio_task():
+            return await to_asyncio_future(get_value_by_tornado_coroutine())
+
+        # when
+        with self.assertRaises(Exception) as context:
+            await asyncio.ensure_future(get_value_in_asyncio_task())
+
+        # then
+        expected = CachedMethodFailedException('Refresh timed out')
+        self.assertEqual(str(expected), str(context.exception))  # ToDo: consider better comparision
+
+    @gen_test
+    async def test_should_throw_exception_on_concurrent_refresh_failure(self):
+        # given
+        @memoize()
+        async def get_value(arg, kwarg=None):
+            await asyncio.sleep(.050)
+            raise ValueError("Get lost")
+
+        # when
+        first = asyncio.ensure_future(self._as_asyncio(get_value('test1', kwarg='args1')))
+        await asyncio.sleep(0)
+        with self.assertRaises(Exception) as context:
+            await self._as_asyncio(get_value('test1', kwarg='args1'))
+        with self.assertRaises(Exception):
+            await first
+
+        # then
+        expected = CachedMethodFailedException('Concurrent refresh failed to complete')
+        self.assertEqual(str(expected), str(context.exception))  # ToDo: consider better comparision
+        self.assertIsInstance(context.exception.__cause__, ValueError)
+
+    @staticmethod
+    def _as_asyncio(call):
+        # see: _call_thrice
+        return call if memoize_configuration.force_asyncio else to_asyncio_future(call)
+
     @staticmethod
     async def _call_thrice(call):
         # gen_test setup somehow interferes with coroutines and futures
@@ -0,0 +1,64 @@
+from tests.py310workaround import fix_python_3_10_compatibility
+
+fix_python_3_10_compatibility()
+
+import pickle
+from datetime import datetime, timezone, timedelta
+
+from tornado.testing import AsyncTestCase
+
+from memoize.entry import CacheEntry
+
+
+class CacheEntryTests(AsyncTestCase):
+
+    def test_should_compute_integer_deadlines_treating_naive_datetimes_as_utc(self):
+        # given/when
+        entry = CacheEntry(datetime.utcfromtimestamp(1), datetime.utcfromtimestamp(2),
+                           datetime.utcfromtimestamp(3.5), "value")
+
+        # then
+        self.assertEqual(2000000000, entry.update_after_ns)
+        self.assertEqual(3500000000, entry.expires_after_ns)
+
+    def test_should_compute_integer_deadlines_for_aware_datetimes(self):
+        # given
+        tz = timezone(timedelta(hours=2))
+
+        # when
+        entry = CacheEntry(datetime.fromtimestamp(1, tz), datetime.fromtimestamp(2, tz),
+                           datetime.fromtimestamp(3, tz), "value")
+
+        # then
+        self.assertEqual(2000000000, entry.update_after_ns)
+        self.assertEqual(3000000000, entry.expires_after_ns)
+
+    def test_should_restore_integer_deadlines_on_unpickling(self):
+        # given
+        entry = CacheEntry(datetime.utcfromtimestamp(1), datetime.utcfromtimestamp(2),
+                           datetime.utcfromtimestamp(3), "value")
+
+        for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+            # when
+            restored = pickle.loads(pickle.dumps(entry, protocol=protocol))
+
+            # then
+            self.assertEqual(entry, restored)
+            self.assertEqual(2000000000, restored.update_after_ns)
+            self.assertEqual(3000000000, restored.expires_after_ns)
+
+    def test_should_restore_state_pickled_by_dict_based_entries(self):
+        # given
+        created, update_after, expires_after = (datetime.utcfromtimestamp(1), datetime.utcfromtimestamp(2),
+                                                datetime.utcfromtimestamp(3))
+        state = {'value': "value", 'created': created, 'update_after': update_after, 'expires_after': expires_after,
+                 '_CacheEntry__hashable': ("value", created, update_after, expires_after)}
+        restored = CacheEntry.__new__(CacheEntry)
+
+        # when
+        restored.__setstate__(state)
+
+        # then
+        self.assertEqual(CacheEntry(created, update_after, expires_after, "value"), restored)
+        self.assertEqual(3000000000, restored.expires_after_ns)
+        self.assertFalse(hasattr(restored, '__dict__'))
@@ -2,6 +2,7 @@ from tests.py310workaround import fix_python_3_10_compatibility
 
 fix_python_3_10_compatibility()
 
+import collections
 import time
 from datetime import timedelta
 from unittest.mock import Mock
@@ -13,6 +14,7 @@ from tornado.testing import AsyncTestCase, gen_test
 from tests import _ensure_background_tasks_finished, _assert_called_once_with, AnyObject, _as_future
 from memoize.configuration import MutableCacheConfiguration, DefaultInMemoryCacheConfiguration
 from memoize.entrybuilder import ProvidedLifeSpanCacheEntryBuilder
+from memoize.eviction import EvictionStrategy
 from memoize.wrapper import memoize
 
 
@@ -106,6 +108,122 @@ class EvictionStrategyInteractionsTests(AsyncTestCase):
         # then
         eviction_strategy.mark_read.assert_called_once_with('key')
 
+    @gen_test
+    def test_should_inform_eviction_strategy_on_entries_mark_read_in_batch(self):
+        # given
+        key_extractor = Mock()
+        key_extractor.format_key = Mock(side_effect=lambda method, args, kwargs: str(args[0]))
+
+        eviction_strategy = BatchedReadsLeastRecentlyUsedEvictionStrategy(capacity=2)
+
+        @memoize(
+            configuration=MutableCacheConfiguration
+                .initialized_with(DefaultInMemoryCacheConfiguration())
+                .set_key_extractor(key_extractor)
+                .set_eviction_strategy(eviction_strategy)
+        )
+        @gen.coroutine
+        def sample_method(arg, kwarg=None):
+            return arg, kwarg
+
+        yield [sample_method('a'), sample_method('b')]
+        yield _ensure_background_tasks_finished()
+
+        # when
+        yield [sample_method('a'), sample_method('b'), sample_method('a')]
+        yield _ensure_background_tasks_finished()
+
+        # then
+        self.assertEqual([('written', 'a'), ('written', 'b'), ('read', ['a', 'b', 'a'])],
+                         eviction_strategy.events)
+
+    @gen_test
+    def test_should_inform_stateful_eviction_strategy_on_entry_read_before_release(self):
+        # given
+        key_extractor = Mock()
+        key_extractor.format_key = Mock(side_effect=lambda method, args, kwargs: str(args[0]))
+
+        eviction_strategy = LeastRecentlyUsedEvictionStrategy(capacity=1)
+
+        @memoize(
+            configuration=MutableCacheConfiguration
+                .initialized_with(DefaultInMemoryCacheConfiguration())
+                .set_key_extractor(key_extractor)
+                .set_eviction_strategy(eviction_strategy)
+        )
+        @gen.coroutine
+        def sample_method(arg, kwarg=None):
+            return arg, kwarg
+
+        # when
+        yield sample_method('a')
+        yield sample_method('b')
+        yield sample_method('a')
+        yield _ensure_background_tasks_finished()
+
+        # then
+        self.assertEqual([('written', 'a'), ('written', 'b'), ('read', 'a'), ('released', 'a')],
+                         eviction_strategy.events)
+
+    @gen_test
+    def test_should_inform_stateful_eviction_strategy_on_entries_read_in_batch_before_release(self):
+        # given
+        key_extractor = Mock()
+        key_extractor.format_key = Mock(side_effect=lambda method, args, kwargs: str(args[0]))
+
+        eviction_strategy = BatchedReadsLeastRecentlyUsedEvictionStrategy(capacity=1)
+
+        @memoize(
+            configuration=MutableCacheConfiguration
+                .initialized_with(DefaultInMemoryCacheConfiguration())
+                .set_key_extractor(key_extractor)
+                .set_eviction_strategy(eviction_strategy)
+        )
+        @gen.coroutine
+        def sample_method(arg, kwarg=None):
+            return arg, kwarg
+
+        # when
+        yield sample_method('a')
+        yield sample_method('b')
+        yield sample_method('a')
+        yield _ensure_background_tasks_finished()
+
+        # then
+        self.assertEqual([('written', 'a'), ('written', 'b'), ('read', ['a']), ('released', 'a')],
+                         eviction_strategy.events)
+
+    @gen_test
+    def test_should_not_read_entry_released_by_other_method_sharing_eviction_strategy(self):
+        # given
+        eviction_strategy = LeastRecentlyUsedEvictionStrategy(capacity=1)
+        configuration = MutableCacheConfiguration \
+            .initialized_with(DefaultInMemoryCacheConfiguration()) \
+            .set_eviction_strategy(eviction_strategy)
+
+        @memoize(configuration=configuration)
+        @gen.coroutine
+        def sample_method(arg):
+            return arg
+
+        @memoize(configuration=configuration)
+        @gen.coroutine
+        def other_method(arg):
+            return arg
+
+        # when
+        yield sample_method(1)
+        yield _ensure_background_tasks_finished()
+        yield other_method(1)
+        yield _ensure_background_tasks_finished()
+        result = yield sample_method(1)
+        yield _ensure_background_tasks_finished()
+
+        # then
+        self.assertEqual(1, result)
+        self.assertEqual(['written', 'written', 'released', 'written', 'released'],
+                         [event for event, key in eviction_strategy.events])
+
     @gen_test
     def test_should_inform_eviction_strategy_entry_mark_released(self):
         # given
@@ -204,3 +322,35 @@ class EvictionStrategyInteractionsTests(AsyncTestCase):
         # then
         eviction_strategy.next_to_release.assert_called_once_with()
         storage.release.assert_called_once_with('release-test')
+
+
+class LeastRecentlyUsedEvictionStrategy(EvictionStrategy):
+    """Stateful strategy (fails on events reported out of order) recording all events."""
+
+    def __init__(self, capacity):
+        self.events = []
+        self._capacity = capacity
+        self._data = collections.OrderedDict()
+
+    def mark_read(self, key):
+        self.events.append(('read', key))
+        self._data.move_to_end(key)
+
+    def mark_written(self, key, entry):
+        self.events.append(('written', key))
+        self._data[key] = None
+        self._data.move_to_end(key)
+
+    def mark_released(self, key):
+        self.events.append(('released', key))
+        del self._data[key]
+
+    def next_to_release(self):
+        return next(iter(self._data)) if len(self._data) > self._capacity else None
+
+
+class BatchedReadsLeastRecentlyUsedEvictionStrategy(LeastRecentlyUsedEvictionStrategy):
+    def mark_read_batch(self, keys):
+        self.events.append(('read', keys))
+        for key in keys:
+            self._data.move_to_end(key)
@@ -96,6 +96,41 @@ class KeyExtractorInteractionsTests(AsyncTestCase):
         eviction_strategy.mark_read.assert_called_once_with('key')
         _assert_called_once_with(self, eviction_strategy.mark_written, ('key', AnyObject()), {})
 
+    @gen_test
+    def test_should_pass_same_keys_as_built_in_key_extractor_formats(self):
+        # given
+        key_extractor = EncodedMethodNameAndArgsKeyExtractor()
+
+        storage = Mock()
+        storage.get = Mock(return_value=_as_future(None))
+        storage.offer = Mock(return_value=_as_future(None))
+
+        @memoize(
+            configuration=MutableCacheConfiguration
+                .initialized_with(DefaultInMemoryCacheConfiguration())
+                .set_key_extractor(key_extractor)
+                .set_storage(storage)
+        )
+        @gen.coroutine
+        def sample_method(arg, kwarg=None):
+            return arg, kwarg
+
+        # when
+        yield sample_method(1, kwarg='args')
+        yield sample_method(True, kwarg='args')
+        yield sample_method(1, kwarg='args')
+        yield sample_method(0.0, kwarg=['args'])
+        yield sample_method(-0.0, kwarg=['args'])
+        yield _ensure_background_tasks_finished()
+
+        # then
+        keys = [args[0] for args, kwargs in storage.get.call_args_list]
+        self.assertEqual(keys, ["('sample_method', (1,), {'kwarg': 'args'})",
+                                "('sample_method', (True,), {'kwarg': 'args'})",
+                                "('sample_method', (1,), {'kwarg': 'args'})",
+                                "('sample_method', (0.0,), {'kwarg': ['args']})",
+                                "('sample_method', (-0.0,), {'kwarg': ['args']})"])
+
 
 class EncodedMethodReferenceAndArgsKeyExtractorTests(AsyncTestCase):
 
@@ -4,7 +4,9 @@ fix_python_3_10_compatibility()
 
 import codecs
 import json
+import math
 import pickle
+import unittest
 from datetime import datetime
 from pickle import HIGHEST_PROTOCOL, DEFAULT_PROTOCOL
 from unittest.mock import Mock
@@ -14,6 +16,11 @@ from tornado.testing import AsyncTestCase, gen_test
 from memoize.entry import CacheEntry
 from memoize.serde import PickleSerDe, EncodingSerDe, JsonSerDe
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 class EncodingSerDeTests(AsyncTestCase):
     @gen_test
@@ -130,6 +137,88 @@ class JsonSerDeTests(AsyncTestCase):
         self.assertEqual(data, cache_entry)
         decode.assert_called_once_with("in")
 
+    @gen_test
+    def test_should_encode_and_decode_using_requested_string_encoding(self):
+        # given
+        cache_entry = CacheEntry(datetime.utcfromtimestamp(1), datetime.utcfromtimestamp(2),
+                                 datetime.utcfromtimestamp(3), "in")
+        serde = JsonSerDe(string_encoding='utf-16')
+
+        # when
+        bytes = serde.serialize(cache_entry)
+
+        # then
+        parsed = json.loads(codecs.decode(bytes, 'utf-16'))
+        self.assertEqual(parsed["value"], "in")
+        self.assertEqual(serde.deserialize(bytes), cache_entry)
+
+    @gen_test
+    def test_should_use_provided_json_functions(self):
+        # given
+        cache_entry = CacheEntry(datetime.utcfromtimestamp(1), datetime.utcfromtimestamp(2),
+                                 datetime.utcfromtimestamp(3), "in")
+        encoder = Mock(side_effect=json.dumps)
+        decoder = Mock(side_effect=json.loads)
+        serde = JsonSerDe(string_encoding='utf-8', encoder=encoder, decoder=decoder)
+
+        # when
+        data = serde.deserialize(serde.serialize(cache_entry))
+
+        # then
+        self.assertEqual(data, cache_entry)
+        encoder.assert_called_once_with({"created": cache_entry.created.timestamp(),
+                                         "update_after": cache_entry.update_after.timestamp(),
+                                         "expires_after": cache_entry.expires_after.timestamp(),
+                                         "value": "in"})
+        decoder.assert_called_once()
+
+
+    @gen_test
+    def test_should_not_use_orjson_unless_requested(self):
+        # given
+        cache_entry = CacheEntry(datetime.utcfromtimestamp(1), datetime.utcfromtimestamp(2),
+                                 datetime.utcfromtimestamp(3), float('nan'))
+        serde = JsonSerDe(string_encoding='utf-8')
+
+        # when
+        data = serde.deserialize(serde.serialize(cache_entry))
+
+        # then
+        self.assertTrue(math.isnan(data.value))  # orjson would write NaN as null
+
+    @unittest.skipIf(orjson is None, 'orjson is not installed')
+    @gen_test
+    def test_should_encode_and_decode_using_orjson_on_request(self):
+        # given
+        cache_entry = CacheEntry(datetime.utcfromtimestamp(1), datetime.utcfromtimestamp(2),
+                                 datetime.utcfromtimestamp(3), {"in": [1, "2"]})
+        serde = JsonSerDe(string_encoding='utf-8', use_orjson=True)
+
+        # when
+        bytes = serde.serialize(cache_entry)
+
+        # then
+        self.assertEqual(json.loads(codecs.decode(bytes))["value"], {"in": [1, "2"]})
+        self.assertEqual(serde.deserialize(bytes), cache_entry)
+
+    @unittest.skipIf(orjson is None, 'orjson is not installed')
+    @gen_test
+    def test_should_reject_datetime_values_using_orjson(self):
+        # given
+        cache_entry = CacheEntry(datetime.utcfromtimestamp(1), datetime.utcfromtimestamp(2),
+                                 datetime.utcfromtimestamp(3), datetime.utcfromtimestamp(4))
+        serde = JsonSerDe(string_encoding='utf-8', use_orjson=True)
+
+        # when/then
+        with self.assertRaises(TypeError):
+            serde.serialize(cache_entry)
+
+    @unittest.skipIf(orjson is None, 'orjson is not installed')
+    def test_should_reject_orjson_with_other_encoding(self):
+        # given/when/then
+        with self.assertRaises(ValueError):
+            JsonSerDe(string_encoding='utf-16', use_orjson=True)
+
 
 class PickleSerDeTests(AsyncTestCase):
     @gen_test
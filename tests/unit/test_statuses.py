@@ -44,6 +44,28 @@ class UpdateStatusesTests(AsyncTestCase):
         # then
         self.assertTrue(self.update_statuses.is_being_updated('key'))
 
+    def test_should_begin_update_if_not_being_updated(self):
+        # given/when
+        result = self.update_statuses.try_begin_update('key')
+
+        # then
+        self.assertIsNone(result)
+        self.assertTrue(self.update_statuses.is_being_updated('key'))
+
+    @gen_test
+    async def test_should_return_update_in_progress_on_begin_update(self):
+        # given
+        self.update_statuses.mark_being_updated('key')
+
+        # when
+        result = self.update_statuses.try_begin_update('key')
+        self.update_statuses.mark_updated('key', 'entry')
+        result = await result
+
+        # then
+        self.assertEqual('entry', result)
+        self.assertFalse(self.update_statuses.is_being_updated('key'))
+
     def test_should_raise_exception_during_be_mark_as_updated(self):
         # given/when/then
         with self.assertRaises(ValueError):
@@ -87,9 +109,26 @@ class UpdateStatusesTests(AsyncTestCase):
         self.update_statuses.mark_being_updated('key')
 
         # when
-        await self.update_statuses.await_updated('key')
+        with self.assertRaises(TimeoutError):
+            await self.update_statuses.await_updated('key')
+
+        # then
+        self.assertFalse(self.update_statuses.is_being_updated('key'))
+
+    @gen_test
+    async def test_should_raise_exception_of_aborted_update_during_await_updated(self):
+        # given
+        self.update_statuses.mark_being_updated('key')
+        exception = ValueError('failed')
+
+        # when
+        result = self.update_statuses.await_updated('key')
+        self.update_statuses.mark_update_aborted('key', exception)
 
         # then
+        with self.assertRaises(ValueError) as context:
+            await result
+        self.assertIs(exception, context.exception)
         self.assertFalse(self.update_statuses.is_being_updated('key'))
 
     @gen_test
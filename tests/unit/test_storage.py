@@ -5,7 +5,7 @@ fix_python_3_10_compatibility()
 from datetime import datetime
 from tornado.testing import AsyncTestCase, gen_test
 from memoize.entry import CacheKey, CacheEntry
-from memoize.storage import LocalInMemoryCacheStorage
+from memoize.storage import LocalInMemoryCacheStorage, CacheStorage, ASYNC_REQUIRED
 
 CACHE_SAMPLE_ENTRY = CacheEntry(datetime.now(), datetime.now(), datetime.now(), "value")
 
@@ -50,3 +50,41 @@ class LocalInMemoryCacheStorageTests(AsyncTestCase):
 
         # then
         self.assertIsNone(returned_value)
+
+    @gen_test
+    def test_try_get_returns_offered_object_without_awaiting(self):
+        # given
+        yield self.storage.offer(CACHE_KEY, CACHE_SAMPLE_ENTRY)
+
+        # when
+        returned_value = self.storage.try_get(CACHE_KEY)
+
+        # then
+        self.assertEqual(returned_value, CACHE_SAMPLE_ENTRY)
+
+    def test_try_get_without_offer_returns_none(self):
+        # given/when
+        returned_value = self.storage.try_get(CACHE_KEY)
+
+        # then
+        self.assertIsNone(returned_value)
+
+
+class CacheStorageTests(AsyncTestCase):
+    def test_try_get_informs_get_has_to_be_awaited_by_default(self):
+        # given
+        class AsyncOnlyStorage(CacheStorage):
+            async def get(self, key):
+                return None
+
+            async def offer(self, key, entry):
+                pass
+
+            async def release(self, key):
+                pass
+
+        # when
+        returned_value = AsyncOnlyStorage().try_get(CACHE_KEY)
+
+        # then
+        self.assertIs(returned_value, ASYNC_REQUIRED)